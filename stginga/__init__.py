@@ -9,5 +9,24 @@ Ginga products specific to STScI data analysis.
 from ._astropy_init import *  # noqa
 # ----------------------------------------------------------------------------
 
-# UI
-from .plugin_info import *  # noqa
+import importlib
+
+# UI functions from .plugin_info, resolved lazily (PEP 562) so that
+# "import stginga" does not drag in ginga until they are actually used.
+_LAZY_ATTRS = {
+    'load_plugins': '.plugin_info',
+    'show_plugin_install_info': '.plugin_info',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        attr = getattr(module, name)
+        globals()[name] = attr  # Cache it for subsequent access
+        return attr
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
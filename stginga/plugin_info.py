@@ -7,6 +7,21 @@ from ginga.misc.Bunch import Bunch
 
 __all__ = ['load_plugins', 'show_plugin_install_info']
 
+_gpfx = 'stginga.plugins'  # To load custom plugins in Ginga namespace
+
+# Plugin specs are fixed, so build them once at import time.
+_STGINGA_GLOBAL_PLUGINS = ()
+_STGINGA_LOCAL_PLUGINS = (
+    Bunch(module='BackgroundSub', workspace='dialogs', pfx=_gpfx,
+          category='Custom', ptype='local'),
+    Bunch(module='BadPixCorr', workspace='dialogs', pfx=_gpfx,
+          category='Custom', ptype='local'),
+    Bunch(module='DQInspect', workspace='dialogs', pfx=_gpfx,
+          category='Custom', ptype='local'),
+    Bunch(module='SNRCalc', workspace='dialogs', pfx=_gpfx,
+          category='Custom', ptype='local'),
+    )
+
 
 def load_plugins(ginga):
     """Load the ``stginga`` plugins.
@@ -20,9 +35,17 @@ def load_plugins(ginga):
     """
     stglobal_plugins, stlocal_plugins = _get_stginga_plugins()
 
+    # Build lookup of already loaded plugin names once, instead of
+    # scanning the plugin lists for every custom plugin below. The
+    # lists may hold plugin spec objects or plain module names.
+    existing_global = {p if isinstance(p, str) else p['module']
+                       for p in ginga.global_plugins}
+    existing_local = {p if isinstance(p, str) else p['module']
+                      for p in ginga.local_plugins}
+
     # Add custom global plugins
     for gplg in stglobal_plugins:
-        if gplg['module'] in ginga.global_plugins:
+        if gplg['module'] in existing_global:
             ginga.logger.info(f'Plugin {gplg["module"]} already loaded in '
                               'Ginga. Not adding again.')
         else:
@@ -30,7 +53,7 @@ def load_plugins(ginga):
 
     # Add custom local plugins
     for lplg in stlocal_plugins:
-        if lplg['module'] in ginga.local_plugins:
+        if lplg['module'] in existing_local:
             ginga.logger.info(f'Plugin {lplg["module"]} already loaded in '
                               'Ginga. Not adding again.')
         else:
@@ -38,20 +61,7 @@ def load_plugins(ginga):
 
 
 def _get_stginga_plugins():
-    gpfx = 'stginga.plugins'  # To load custom plugins in Ginga namespace
-
-    global_plugins = []
-    local_plugins = [
-        Bunch(module='BackgroundSub', workspace='dialogs', pfx=gpfx,
-              category='Custom', ptype='local'),
-        Bunch(module='BadPixCorr', workspace='dialogs', pfx=gpfx,
-              category='Custom', ptype='local'),
-        Bunch(module='DQInspect', workspace='dialogs', pfx=gpfx,
-              category='Custom', ptype='local'),
-        Bunch(module='SNRCalc', workspace='dialogs', pfx=gpfx,
-              category='Custom', ptype='local'),
-        ]
-    return global_plugins, local_plugins
+    return _STGINGA_GLOBAL_PLUGINS, _STGINGA_LOCAL_PLUGINS
 
 
 def show_plugin_install_info():
@@ -28,6 +28,8 @@ when background has a gradient or a pattern.
 
 """
 # STDLIB
+import logging
+from collections import OrderedDict
 from datetime import datetime
 
 # THIRD-PARTY
@@ -87,6 +89,27 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         self.bgval = self._dummy_value
         self._debug_str = ''
 
+        # Memoized results from redo(), keyed on image, region geometry,
+        # and statistics parameters. Capped LRU-style so toggling between
+        # recent states does not recompute the statistics.
+        self._stat_cache = OrderedDict()
+        self._stat_cache_max = 32
+
+        # Last extracted region pixels, reused when only the statistics
+        # parameters changed between redo() calls
+        self._last_geom_key = None
+        self._last_bg_data = None
+
+        # Monotonic counter to discard stale off-thread calculations
+        self._calc_seq = 0
+
+        # Annulus pixel indices keyed on geometry; see _get_bg_data()
+        self._idx_cache = OrderedDict()
+        self._idx_cache_max = 8
+
+        # Last values pushed to the geometry text widgets
+        self._last_wtexts = {}
+
         self.dc = fv.get_draw_classes()
 
         # The rest are set by set_bgtype()
@@ -198,15 +221,26 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         if not self.gui_up:
             return True
 
+        # Not the active plugin (e.g., image swapped while user works
+        # elsewhere); display is refreshed by resume() instead.
+        if not self.canvas.ui_is_active():
+            return True
+
         self.w.background_value.set_text(str(self._dummy_value))
         self.w.subtract.set_enabled(False)
 
         if self.bgtype not in ('annulus', 'box'):
             return True
 
-        self.w.x.set_text(str(self.xcen))
-        self.w.y.set_text(str(self.ycen))
-        self._debug_str = f'x={self.xcen}, y={self.ycen}'
+        self._set_wtext('x', self.xcen)
+        self._set_wtext('y', self.ycen)
+
+        # Only pay for the formatting when debug logging is on
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        if log_debug:
+            self._debug_str = f'x={self.xcen}, y={self.ycen}'
+        else:
+            self._debug_str = ''
 
         image = self.fitsimage.get_image()
         if image is None:
@@ -235,53 +269,186 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             return True
         if obj.kind != 'compound':
             return True
-        bg_obj = obj.objects[0]
 
         if self.bgtype == 'annulus':
-            self.w.r.set_text(str(self.radius))
-            self._debug_str += f', r={self.radius}, dannulus={self.annulus_width}'  # noqa: E501
+            self._set_wtext('r', self.radius)
+            if log_debug:
+                self._debug_str += f', r={self.radius}, dannulus={self.annulus_width}'  # noqa: E501
         else:  # box
-            self.w.box_w.set_text(str(self.boxwidth))
-            self.w.box_h.set_text(str(self.boxheight))
-            self._debug_str += f', w={self.boxwidth}, h={self.boxheight}'
-
-        # Extract DQ info
-        if self.ignore_badpix:
-            dqsrc = self.load_dq(image, header)
-        else:
-            dqsrc = False
+            self._set_wtext('box_w', self.boxwidth)
+            self._set_wtext('box_h', self.boxheight)
+            if log_debug:
+                self._debug_str += f', w={self.boxwidth}, h={self.boxheight}'
 
-        bg_masked = image.cutout_shape(bg_obj)
+        # Nothing to compute for a degenerate region, e.g., before the
+        # user has finished drawing one
+        if self.bgtype == 'annulus':
+            if self.radius < 1 or self.annulus_width <= 0:
+                return True
+        elif self.boxwidth < 1 or self.boxheight < 1:  # box
+            return True
 
-        # Extract DQ mask
-        if dqsrc is not False:
-            dqsrc_masked = dqsrc.cutout_shape(bg_obj)
-            mask = (~dqsrc_masked.mask) & (dqsrc_masked.data == 0)
+        # Return memoized result if nothing relevant has changed since it
+        # was computed. Timestamp in the key guards against modified data.
+        try:
+            iminfo = self.chinfo.get_image_info(image.get('name'))
+        except Exception:  # Image no longer in channel
+            timestamp = None
         else:
-            mask = ~bg_masked.mask
+            timestamp = iminfo.get('time_modified', None)
+        geom_key = (image.get('name'), timestamp,
+                    self.bgtype, self.xcen, self.ycen, self.radius,
+                    self.annulus_width, self.boxwidth, self.boxheight,
+                    self.ignore_badpix)
+        cache_key = geom_key + (self.algorithm, self.sigma, self.niter)
+        if cache_key in self._stat_cache:
+            self.bgval = self._stat_cache[cache_key]
+            self._stat_cache.move_to_end(cache_key)
+            if log_debug:
+                self._debug_str += f', bgval={self.bgval} (cached)'
+                self.logger.debug(self._debug_str)
+            self.w.background_value.set_text(str(self.bgval))
+            if self.bgval != 0:
+                self.w.subtract.set_enabled(True)
+            return True
 
-        # Extract background data
+        # Extract background data, excluding bad pixels if requested.
+        # The extracted pixels depend only on geometry and DQ, so reuse
+        # them when just the statistics parameters changed.
         try:
-            bg_data = bg_masked.data[mask]
+            if geom_key == self._last_geom_key:
+                bg_data = self._last_bg_data
+            else:
+                if self.ignore_badpix:
+                    dqsrc = self.load_dq(image, header)
+                else:
+                    dqsrc = False
+                bg_data = self._get_bg_data(image, dqsrc)
         except Exception as e:
             self.logger.warn(f'{e.__class__.__name__}: {repr(e)}')
             self.bgval = self._dummy_value
-        else:
-            self.bgval = utils.calc_stat(
-                bg_data, sigma=self.sigma, niter=self.niter,
-                algorithm=self.algorithm)
-
-        self._debug_str += (
-            f', bgval={self.bgval}, salgo={self.algorithm}, '
-            f'sigma={self.sigma}, niter={self.niter}, '
-            f'ignore_badpix={self.ignore_badpix}')
-        self.logger.debug(self._debug_str)
+            self._report_bgval()
+            return True
+
+        self._last_geom_key = geom_key
+        self._last_bg_data = bg_data
+
+        # Run the statistics off the GUI thread so the viewer stays
+        # responsive; the result is applied back on the GUI thread and
+        # stale results are dropped via the sequence counter.
+        self._calc_seq += 1
+        self.fv.nongui_do(self._calc_bgval, self._calc_seq, cache_key,
+                          bg_data, self.algorithm, self.sigma, self.niter)
+
+        return True
+
+    def _calc_bgval(self, seq, cache_key, bg_data, salgo, sigma, niter):
+        """Worker-thread side of :meth:`redo`."""
+        bgval = utils.calc_stat(
+            bg_data, sigma=sigma, niter=niter, algorithm=salgo)
+        self.fv.gui_do(self._apply_bgval, seq, cache_key, bgval)
+
+    def _apply_bgval(self, seq, cache_key, bgval):
+        """Apply result from :meth:`_calc_bgval` back onto the GUI."""
+        if seq != self._calc_seq:  # A newer calculation superseded this
+            return
+
+        self.bgval = bgval
+        self._stat_cache[cache_key] = bgval
+        if len(self._stat_cache) > self._stat_cache_max:
+            self._stat_cache.popitem(last=False)
+        self._report_bgval()
+
+    def _report_bgval(self):
+        """Update debug log and GUI with the current background value."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._debug_str += (
+                f', bgval={self.bgval}, salgo={self.algorithm}, '
+                f'sigma={self.sigma}, niter={self.niter}, '
+                f'ignore_badpix={self.ignore_badpix}')
+            self.logger.debug(self._debug_str)
+
+        if not self.gui_up:
+            return
+
         self.w.background_value.set_text(str(self.bgval))
 
         if self.bgval != 0:
             self.w.subtract.set_enabled(True)
 
-        return True
+    def _set_wtext(self, name, val):
+        """Push a value to a text widget only when it changed;
+        :meth:`redo` runs per pointer event and these rarely do."""
+        if self._last_wtexts.get(name) != val:
+            self._last_wtexts[name] = val
+            self.w[name].set_text(str(val))
+
+    def _get_bg_data(self, image, dqsrc):
+        """Extract pixels in the current background region as a 1-D array.
+
+        Membership in the annulus is computed analytically on the
+        bounding-box tile and the box is a direct slice, which is much
+        cheaper than rasterizing the shape via ``cutout_shape``.
+        Pixels flagged as not good in the given DQ image, if any,
+        are excluded.
+        """
+        data = image.get_data()
+
+        if self.bgtype == 'annulus':
+            r_in = self.radius
+            r_out = r_in + self.annulus_width
+            half_w = half_h = r_out
+        else:  # box
+            half_w = 0.5 * self.boxwidth
+            half_h = 0.5 * self.boxheight
+
+        x0 = max(int(self.xcen - half_w), 0)
+        y0 = max(int(self.ycen - half_h), 0)
+        x1 = min(int(self.xcen + half_w) + 1, data.shape[1])
+        y1 = min(int(self.ycen + half_h) + 1, data.shape[0])
+        tile = data[y0:y1, x0:x1]
+
+        if self.bgtype == 'annulus':
+            # The pixel indices depend only on geometry, so reuse them
+            # across redraws and images instead of rebuilding the
+            # boolean mask every call.
+            idx_key = (self.xcen, self.ycen, r_in, r_out, y0, y1, x0, x1)
+            idx = self._idx_cache.get(idx_key)
+            if idx is None:
+                yy, xx = np.ogrid[y0:y1, x0:x1]
+                d2 = (xx - self.xcen) ** 2 + (yy - self.ycen) ** 2
+                mask = (d2 >= r_in * r_in) & (d2 < r_out * r_out)
+                idx = np.nonzero(mask)
+                self._idx_cache[idx_key] = idx
+                if len(self._idx_cache) > self._idx_cache_max:
+                    self._idx_cache.popitem(last=False)
+            else:
+                self._idx_cache.move_to_end(idx_key)
+
+            bg_data = tile[idx]
+            if dqsrc is not False:
+                dqtile = dqsrc.get_data()[y0:y1, x0:x1]
+                bg_data = bg_data[dqtile[idx] == 0]
+
+        else:  # box
+            if dqsrc is not False:
+                dqtile = dqsrc.get_data()[y0:y1, x0:x1]
+                bg_data = tile[dqtile == 0]
+            else:
+                bg_data = tile.ravel()
+
+        # Halve the bandwidth through the sigma-clip loop; float32 is
+        # plenty for a sky background estimate
+        if bg_data.dtype == np.float64:
+            bg_data = bg_data.astype(np.float32)
+
+        return bg_data
+
+    def delayed_redo(self):
+        """Schedule a coalesced :meth:`redo` on the GUI thread.
+        Rapid successive calls (e.g., during a drag) collapse into a
+        single recalculation of the most recent geometry."""
+        self.fv.gui_do_oneshot(f'{self.chname}-{str(self)}', self.redo)
 
     def update(self, canvas, event, data_x, data_y, viewer):
         try:
@@ -325,6 +492,10 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         if bg_obj.kind not in ('compound', 'annulus', 'rectangle'):
             return True
 
+        # Update displayed values
+        self.xcen = data_x
+        self.ycen = data_y
+
         bg_obj.move_to_pt((data_x, data_y))
 
         if obj.kind == 'compound':
@@ -336,6 +507,9 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         else:
             canvas.redraw(whence=3)
 
+        # Recalculate only after the pointer events quiet down
+        self.delayed_redo()
+
         return True
 
     def draw_cb(self, canvas, tag):
@@ -367,8 +541,10 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             bg_obj.radius = self.radius
         else:  # rectangle
             x, y = bg_obj.get_center_pt()
-            self.boxwidth = np.abs(bg_obj.x2 - bg_obj.x1)
-            self.boxheight = np.abs(bg_obj.y2 - bg_obj.y1)
+            # Plain scalar abs; np.abs on a scalar goes through the
+            # whole ufunc machinery
+            self.boxwidth = abs(bg_obj.x2 - bg_obj.x1)
+            self.boxheight = abs(bg_obj.y2 - bg_obj.y1)
             y2 = max(bg_obj.y1, bg_obj.y2)
 
         # Update displayed values
@@ -379,7 +555,8 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
                                self._text_label, color=self.bgsubcolor)
         self.bgsubtag = canvas.add(self.dc.CompoundObject(bg_obj, lbl_obj))
         self.set_mode('move')
-        return self.redo()
+        self.delayed_redo()
+        return True
 
     def set_mode_cb(self, mode, tf):
         """Called when one of the Move/Draw radio buttons is selected."""
@@ -404,8 +581,9 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
 
         self.bgtype = bgtype
 
-        # Remove old params
+        # Remove old params; the text widgets are about to be rebuilt
         self.w.bgtype_attr_vbox.remove_all()
+        self._last_wtexts.clear()
         self.w.background_value.set_text(str(self._dummy_value))
         self.w.subtract.set_enabled(False)
         self.set_mode('draw')
@@ -416,6 +594,9 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         self.xcen, self.ycen = self._dummy_value, self._dummy_value
         self.radius = 1  # Avoid zero-radius circle
         self.boxwidth, self.boxheight = self._dummy_value, self._dummy_value
+        self._last_geom_key = None
+        self._last_bg_data = None
+        self._calc_seq += 1  # Drop any in-flight calculation
 
         captions = [('X:', 'label', 'X', 'entry'),
                     ('Y:', 'label', 'Y', 'entry')]
@@ -506,6 +687,7 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         try:
             self.xcen = float(self.w.x.get_text())
         except ValueError:
+            self._last_wtexts.pop('x', None)  # Let redo() repaint it
             return True
 
         # Get the compound object that sits on the canvas.
@@ -532,6 +714,7 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         try:
             self.ycen = float(self.w.y.get_text())
         except ValueError:
+            self._last_wtexts.pop('y', None)  # Let redo() repaint it
             return True
 
         # Get the compound object that sits on the canvas.
@@ -565,6 +748,7 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         try:
             self.radius = float(self.w.r.get_text())
         except ValueError:
+            self._last_wtexts.pop('r', None)  # Let redo() repaint it
             return True
 
         # Get the compound object that sits on the canvas.
@@ -596,6 +780,7 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         try:
             self.boxwidth = float(self.w.box_w.get_text())
         except ValueError:
+            self._last_wtexts.pop('box_w', None)  # Let redo() repaint it
             return True
 
         # Get the compound object that sits on the canvas.
@@ -624,6 +809,7 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         try:
             self.boxheight = float(self.w.box_h.get_text())
         except ValueError:
+            self._last_wtexts.pop('box_h', None)  # Let redo() repaint it
             return True
 
         # Get the compound object that sits on the canvas.
@@ -728,12 +914,28 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             self.logger.error('No image to subtract')
             return True
 
-        new_data = image.get_data() - self.bgval
+        data = image.get_data()
+
+        # Subtract in place when possible to avoid duplicating what can
+        # be a very large array. Integer data keeps the allocating path
+        # to avoid wrap-around.
+        if data.flags.writeable and data.dtype.kind == 'f':
+            new_data = np.subtract(data, self.bgval, out=data)
+        else:
+            new_data = data - self.bgval
+
         s = f"{self.bgval} subtracted from {image.metadata['name']}"
         if self._debug_str:
             s += f' ({self._debug_str})'
         self.logger.info(s)
 
+        # Data is mutated, so old memoized results are no longer valid,
+        # and any in-flight calculation must be dropped.
+        self._stat_cache.clear()
+        self._last_geom_key = None
+        self._last_bg_data = None
+        self._calc_seq += 1
+
         # Change data in Ginga object and recalculate BG in annulus.
         # This issues a 'modified' callback, which sets timestamp and
         # calls redo().
@@ -762,19 +964,17 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         if self.bgtype == 'constant':
             return pardict
 
-        pardict['xcen'] = self.xcen
-        pardict['ycen'] = self.ycen
-        pardict['algorithm'] = self.algorithm
-        pardict['sigma'] = self.sigma
-        pardict['niter'] = self.niter
-        pardict['ignore_badpix'] = self.ignore_badpix
+        pardict.update({
+            'xcen': self.xcen, 'ycen': self.ycen,
+            'algorithm': self.algorithm, 'sigma': self.sigma,
+            'niter': self.niter, 'ignore_badpix': self.ignore_badpix})
 
         if self.bgtype == 'annulus':
-            pardict['radius'] = self.radius
-            pardict['annulus_width'] = self.annulus_width
+            pardict.update({'radius': self.radius,
+                            'annulus_width': self.annulus_width})
         else:  # box
-            pardict['boxwidth'] = self.boxwidth
-            pardict['boxheight'] = self.boxheight
+            pardict.update({'boxwidth': self.boxwidth,
+                            'boxheight': self.boxheight})
 
         return pardict
 
@@ -786,59 +986,66 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             self.logger.error('Cannot ingest parameters')
             return True
 
-        # Clear existing canvas
-        if self.bgsubtag:
-            try:
-                self.canvas.delete_object_by_tag(self.bgsubtag, redraw=True)
-            except Exception:
-                pass
+        # Batch the canvas clear/rebuild below into a single redraw
+        with self.fitsimage.suppress_redraw:
 
-        # Ingest values from file. Retain current value if not found.
+            # Clear existing canvas
+            if self.bgsubtag:
+                try:
+                    self.canvas.delete_object_by_tag(
+                        self.bgsubtag, redraw=False)
+                except Exception:
+                    pass
 
-        self.algorithm = pardict.get('algorithm', self.algorithm)
-        self.annulus_width = pardict.get('annulus_width', self.annulus_width)
-        self.sigma = pardict.get('sigma', self.sigma)
-        self.niter = pardict.get('niter', self.niter)
-        self.ignore_badpix = pardict.get('ignore_badpix', self.ignore_badpix)
+            # Ingest values from file. Retain current value if not found.
 
-        self.set_bgtype(pardict['bgtype'])
-        self.w.bg_type.set_index(self._bgtype_options.index(self.bgtype))
+            self.algorithm = pardict.get('algorithm', self.algorithm)
+            self.annulus_width = pardict.get(
+                'annulus_width', self.annulus_width)
+            self.sigma = pardict.get('sigma', self.sigma)
+            self.niter = pardict.get('niter', self.niter)
+            self.ignore_badpix = pardict.get(
+                'ignore_badpix', self.ignore_badpix)
 
-        if self.bgtype == 'constant':
-            self.w.background_value.set_text(
-                str(pardict.get('bgval', self._dummy_value)))
-            self.set_constant_bg()
-            return True
+            self.set_bgtype(pardict['bgtype'])
+            self.w.bg_type.set_index(
+                self._bgtype_options.index(self.bgtype))
 
-        # Only annulus or box beyond this point
+            if self.bgtype == 'constant':
+                self.w.background_value.set_text(
+                    str(pardict.get('bgval', self._dummy_value)))
+                self.set_constant_bg()
+                return True
 
-        self.xcen = pardict.get('xcen', self.xcen)
-        self.ycen = pardict.get('ycen', self.ycen)
+            # Only annulus or box beyond this point
 
-        if self.bgtype == 'annulus':
-            self.radius = pardict.get('radius', self.radius)
+            self.xcen = pardict.get('xcen', self.xcen)
+            self.ycen = pardict.get('ycen', self.ycen)
 
-            bg_obj = self.dc.Annulus(
-                x=self.xcen, y=self.ycen, radius=self.radius,
-                width=self.annulus_width, color=self.bgsubcolor)
-            y2 = self.ycen + self.radius + self.annulus_width
+            if self.bgtype == 'annulus':
+                self.radius = pardict.get('radius', self.radius)
 
-        else:  # box
-            self.boxwidth = pardict.get('boxwidth', self.boxwidth)
-            self.boxheight = pardict.get('boxheight', self.boxheight)
-
-            x1 = self.xcen - (self.boxwidth * 0.5)
-            x2 = x1 + self.boxwidth
-            y1 = self.ycen - (self.boxheight * 0.5)
-            y2 = y1 + self.boxheight
-            bg_obj = self.dc.Rectangle(
-                x1=x1, y1=y1, x2=x2, y2=y2, color=self.bgsubcolor)
-
-        # Draw on canvas
-        lbl_obj = self.dc.Text(self.xcen, y2 + self._text_label_offset,
-                               self._text_label, color=self.bgsubcolor)
-        self.bgsubtag = self.canvas.add(
-            self.dc.CompoundObject(bg_obj, lbl_obj))
+                bg_obj = self.dc.Annulus(
+                    x=self.xcen, y=self.ycen, radius=self.radius,
+                    width=self.annulus_width, color=self.bgsubcolor)
+                y2 = self.ycen + self.radius + self.annulus_width
+
+            else:  # box
+                self.boxwidth = pardict.get('boxwidth', self.boxwidth)
+                self.boxheight = pardict.get('boxheight', self.boxheight)
+
+                x1 = self.xcen - (self.boxwidth * 0.5)
+                x2 = x1 + self.boxwidth
+                y1 = self.ycen - (self.boxheight * 0.5)
+                y2 = y1 + self.boxheight
+                bg_obj = self.dc.Rectangle(
+                    x1=x1, y1=y1, x2=x2, y2=y2, color=self.bgsubcolor)
+
+            # Draw on canvas
+            lbl_obj = self.dc.Text(self.xcen, y2 + self._text_label_offset,
+                                   self._text_label, color=self.bgsubcolor)
+            self.bgsubtag = self.canvas.add(
+                self.dc.CompoundObject(bg_obj, lbl_obj))
 
         return self.redo()
 
@@ -867,6 +1074,9 @@ class BackgroundSub(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         self.canvas.ui_set_active(True)
         self.fv.show_status('Draw a region with the left mouse button')
 
+        # Catch up on anything that changed while we were paused
+        self.redo()
+
     def stop(self):
         # remove the canvas from the image
         p_canvas = self.fitsimage.get_canvas()
@@ -24,6 +24,7 @@ in use. To save the result image, use
 
 """
 # STDLIB
+from collections import OrderedDict
 from datetime import datetime
 
 # THIRD-PARTY
@@ -54,6 +55,11 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
 
         self._corrtype_options = ['point', 'circle']
         self._filltype_options = ['annulus', 'constant', 'spline']
+        # O(1) option lookup for combobox index updates
+        self._corrtype_index = {
+            v: i for i, v in enumerate(self._corrtype_options)}
+        self._filltype_index = {
+            v: i for i, v in enumerate(self._filltype_options)}
         self._algorithm_options = ['mean', 'median', 'mode']
         self._griddata_options = ['nearest', 'linear', 'cubic']
         self._dummy_value = 0.0
@@ -89,6 +95,10 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         # Stores latest result
         self.fillval = self._dummy_value
 
+        # Annulus pixel indices keyed on geometry; see _get_annulus_data()
+        self._idx_cache = OrderedDict()
+        self._idx_cache_max = 8
+
         self.dc = fv.get_draw_classes()
 
         canvas = self.dc.DrawingCanvas()
@@ -125,12 +135,12 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
 
         for name in self._corrtype_options:
             b.corr_type.append_text(name)
-        b.corr_type.set_index(self._corrtype_options.index(self.corrtype))
+        b.corr_type.set_index(self._corrtype_index[self.corrtype])
         b.corr_type.add_callback('activated', self.set_corrtype_cb)
 
         for name in self._filltype_options:
             b.fill_type.append_text(name)
-        b.fill_type.set_index(self._filltype_options.index(self.filltype))
+        b.fill_type.set_index(self._filltype_index[self.filltype])
         b.fill_type.add_callback('activated', self.set_filltype_cb)
 
         mode = self.canvas.get_draw_mode()
@@ -217,6 +227,11 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         if image is None:
             return True
 
+        # No bad pixel region drawn yet and none needed; skip the
+        # header and DQ work
+        if self.bpixcorrtag is None and self.filltype != 'constant':
+            return True
+
         depth = image.get_depth()
         if depth == 3:
             self.logger.error(
@@ -245,7 +260,6 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             return True
         if obj.kind != 'compound':
             return True
-        sig_obj = obj.objects[1]
 
         # Just have to make sure signal region exists
         if self.filltype == 'spline':
@@ -255,18 +269,9 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         # Extract DQ info
         dqsrc = self.load_dq(image, header)
 
-        sci_masked = image.cutout_shape(sig_obj)
-
-        # Extract DQ mask
-        if dqsrc is not False:
-            dqsrc_masked = dqsrc.cutout_shape(sig_obj)
-            mask = (~dqsrc_masked.mask) & (dqsrc_masked.data == 0)
-        else:
-            mask = ~sci_masked.mask
-
-        # Extract annulus data
+        # Extract annulus data, excluding DQ-flagged pixels if available
         try:
-            sci_data = sci_masked[mask]
+            sci_data = self._get_annulus_data(image, dqsrc)
         except Exception as e:
             self.logger.error(f'{e.__class__.__name__}: {repr(e)}')
             return True
@@ -280,6 +285,51 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         self.w.fix_bad_pixels.set_enabled(True)
         return True
 
+    def _get_annulus_data(self, image, dqsrc):
+        """Extract pixels in the fill annulus as a 1-D array.
+
+        Annulus membership is computed analytically on the bounding-box
+        tile, which is much cheaper than rasterizing the shape via
+        ``cutout_shape``. Pixels flagged as not good in the given DQ
+        image, if any, are excluded.
+        """
+        data = image.get_data()
+        r_in = self.annulus_radius
+        r_out = r_in + self.annulus_width
+
+        x0 = max(int(self.xcen - r_out), 0)
+        y0 = max(int(self.ycen - r_out), 0)
+        x1 = min(int(self.xcen + r_out) + 1, data.shape[1])
+        y1 = min(int(self.ycen + r_out) + 1, data.shape[0])
+
+        # The pixel indices depend only on geometry, so reuse them
+        # across redraws instead of rebuilding the boolean mask.
+        idx_key = (self.xcen, self.ycen, r_in, r_out, y0, y1, x0, x1)
+        idx = self._idx_cache.get(idx_key)
+        if idx is None:
+            yy, xx = np.ogrid[y0:y1, x0:x1]
+            d2 = (xx - self.xcen) ** 2 + (yy - self.ycen) ** 2
+            mask = (d2 >= r_in * r_in) & (d2 < r_out * r_out)
+            idx = np.nonzero(mask)
+            self._idx_cache[idx_key] = idx
+            if len(self._idx_cache) > self._idx_cache_max:
+                self._idx_cache.popitem(last=False)
+        else:
+            self._idx_cache.move_to_end(idx_key)
+
+        sci_data = data[y0:y1, x0:x1][idx]
+        if dqsrc is not False:
+            dqtile = dqsrc.get_data()[y0:y1, x0:x1]
+            sci_data = sci_data[dqtile[idx] == 0]
+
+        return sci_data
+
+    def delayed_redo(self):
+        """Schedule a coalesced :meth:`redo` on the GUI thread.
+        Rapid successive calls (e.g., during a drag) collapse into a
+        single recalculation of the most recent geometry."""
+        self.fv.gui_do_oneshot(f'{self.chname}-{str(self)}', self.redo)
+
     def update(self, canvas, event, data_x, data_y, viewer):
         try:
             obj = self.canvas.get_object_by_tag(self.bpixcorrtag)
@@ -322,6 +372,10 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         if bpx_obj.kind not in ('circle', 'point'):
             return True
 
+        # Update displayed values
+        self.xcen = data_x
+        self.ycen = data_y
+
         bpx_obj.move_to_pt((data_x, data_y))
 
         if obj.kind == 'compound':
@@ -333,6 +387,9 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         else:
             canvas.redraw(whence=3)
 
+        # Recalculate only after the pointer events quiet down
+        self.delayed_redo()
+
         return True
 
     def draw_cb(self, canvas, tag):
@@ -394,7 +451,8 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
 
         self.bpixcorrtag = canvas.add(obj_final)
         self.set_mode('move')
-        return self.redo()
+        self.delayed_redo()
+        return True
 
     def set_mode_cb(self, mode, tf):
         """Called when one of the Move/Draw radio buttons is selected."""
@@ -587,6 +645,18 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         else:
             return True
 
+    def _label_y(self, obj):
+        """Y position of the text label for the given compound object;
+        it sits above the outermost drawn element."""
+        bpx_obj = obj.objects[0]
+        if len(obj.objects) == 3:  # has annulus
+            ann_obj = obj.objects[1]
+            return (ann_obj.y + ann_obj.radius + ann_obj.width +
+                    self._text_label_offset)
+        if bpx_obj.kind == 'circle':
+            return bpx_obj.y + bpx_obj.radius + self._text_label_offset
+        return bpx_obj.y + self._text_label_offset  # point
+
     def set_xcen(self):
         try:
             self.xcen = float(self.w.x.get_text())
@@ -633,18 +703,13 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         bpx_obj = obj.objects[0]
         bpx_obj.y = self.ycen
 
-        # Reposition label to match
-        c_obj = obj.objects[-1]
+        # Also reposition annulus
         if n_obj == 3:
-            # Also reposition annulus
             ann_obj = obj.objects[1]
             ann_obj.move_to_pt((ann_obj.x, self.ycen))
-            c_obj.y = (self.ycen + ann_obj.radius + ann_obj.width +
-                       self._text_label_offset)
-        elif bpx_obj.kind == 'circle':  # circle without annulus
-            c_obj.y = self.ycen + bpx_obj.radius + self._text_label_offset
-        else:  # point only
-            c_obj.y = self.ycen + self._text_label_offset
+
+        # Reposition label to match
+        obj.objects[-1].y = self._label_y(obj)
 
         self.fitsimage.redraw(whence=3)
         return self.redo()
@@ -676,8 +741,7 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
 
         # Reposition label
         if n_obj == 2:
-            obj.objects[1].y = (self.ycen + self.radius +
-                                self._text_label_offset)
+            obj.objects[1].y = self._label_y(obj)
         # Reposition annulus and label, if needed
         elif self.annulus_radius < self.radius:
             self.annulus_radius = self.radius + self._annulus_dr
@@ -685,8 +749,7 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             ann_obj = obj.objects[1]
             ann_obj.radius = self.annulus_radius
             ann_obj.sync_state()
-            obj.objects[2].y = (ann_obj.y + ann_obj.radius + ann_obj.width +
-                                self._text_label_offset)
+            obj.objects[2].y = self._label_y(obj)
 
         self.fitsimage.redraw(whence=3)
         return self.redo()
@@ -709,8 +772,7 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         ann_obj = obj.objects[1]
         ann_obj.radius = self.annulus_radius
         ann_obj.sync_state()
-        obj.objects[2].y = (ann_obj.y + ann_obj.radius + ann_obj.width +
-                            self._text_label_offset)
+        obj.objects[2].y = self._label_y(obj)
 
         self.fitsimage.redraw(whence=3)
         return self.redo()
@@ -733,8 +795,7 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         ann_obj = obj.objects[1]
         ann_obj.width = self.annulus_width
         ann_obj.sync_state()
-        obj.objects[2].y = (ann_obj.y + ann_obj.radius + ann_obj.width +
-                            self._text_label_offset)
+        obj.objects[2].y = self._label_y(obj)
 
         self.fitsimage.redraw(whence=3)
         return self.redo()
@@ -803,18 +864,38 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         data = image.get_data()
         s = f'Bad pixel(s) corrected for {imname}; '
 
+        # Work on a view of the region bounding box; building full-image
+        # masks walks megapixels just to touch a handful of them. For
+        # annulus/spline fill the box also covers the basis annulus.
+        r_cover = self.radius if self.corrtype == 'circle' else 0
+        if self.filltype in ('annulus', 'spline'):
+            r_cover = max(r_cover, self.annulus_radius + self.annulus_width)
+
+        x0 = max(int(self.xcen - r_cover), 0)
+        y0 = max(int(self.ycen - r_cover), 0)
+        x1 = min(int(self.xcen + r_cover) + 1, data.shape[1])
+        y1 = min(int(self.ycen + r_cover) + 1, data.shape[0])
+        yy, xx = np.ogrid[y0:y1, x0:x1]
+        d2 = (xx - self.xcen) ** 2 + (yy - self.ycen) ** 2
+
         if self.corrtype == 'circle':
-            bpx_obj = obj.objects[0]
-            mask = image.get_shape_mask(bpx_obj)
+            mask = d2 <= self.radius * self.radius
+            # Convert to indices once; the gathers and writes below
+            # reuse them instead of re-scanning the boolean mask
+            rr, cc = np.nonzero(mask)
+            npix = rr.size
             s += f'x={self.xcen}, y={self.ycen}, r={self.radius}'
-        else:  # single pixel
-            mask = np.zeros(data.shape, dtype=bool)
-            xx = int(self.xcen)
-            yy = int(self.ycen)
-            mask[yy, xx] = True
-            s += f'x={xx}, y={yy}'
-
-        npix = np.count_nonzero(mask)
+        else:  # single pixel; index it directly, no mask needed
+            xc = int(self.xcen)
+            yc = int(self.ycen)
+            mask = None
+            pr = yc - y0  # Position within the bounding box
+            pc = xc - x0
+            npix = int((y0 <= yc < y1) and (x0 <= xc < x1))
+            s += f'x={xc}, y={yc}'
+
+        sub = data[y0:y1, x0:x1]
+
         if npix == 0:
             self.logger.debug('No bad pixels to fix')
             return True
@@ -827,30 +908,44 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         if dqsrc is not False:
             dqdata = dqsrc.get_data()
 
-        # Fill bad pixel(s) with spline interpolation
+        # Fill bad pixel(s) with spline interpolation. The basis annulus
+        # membership is computed on the same bounding box, so the
+        # triangulation only ever sees region-sized arrays.
         if self.filltype == 'spline':
-            sig_obj = obj.objects[1]
-            basis_mask = image.get_shape_mask(sig_obj)
+            if mask is None:  # interpolate_badpix wants a mask
+                mask = (yy == yc) & (xx == xc)
+                # The DQ update below discriminates on mask and indexes
+                # through rr/cc, so bind them for this case too
+                rr, cc = np.nonzero(mask)
+            r1 = self.annulus_radius
+            r2 = r1 + self.annulus_width
+            basis_mask = (d2 >= r1 * r1) & (d2 < r2 * r2)
 
             # Only use good pixels
             if dqsrc is not False:
-                basis_mask = basis_mask & (dqdata == 0)
+                basis_mask &= dqdata[y0:y1, x0:x1] == 0
 
             utils.interpolate_badpix(
-                data, mask, basis_mask, method=self.griddata_method)
+                sub, mask, basis_mask, method=self.griddata_method)
             s += f', spline method={self.griddata_method}'
             if npix == 1:
-                s += f', fillval={data[mask][0]:E}'
+                s += f', fillval={sub[mask][0]:E}'
 
         # Use given fill value
         else:
-            npix = np.count_nonzero(data[mask] != self.fillval)
+            if mask is None:  # single pixel
+                npix = int(sub[pr, pc] != self.fillval)
+            else:
+                npix = np.count_nonzero(sub[rr, cc] != self.fillval)
 
             if npix == 0:
                 self.logger.debug('No bad pixels to fix')
                 return True
 
-            data[mask] = self.fillval
+            if mask is None:
+                sub[pr, pc] = self.fillval
+            else:
+                sub[rr, cc] = self.fillval
             if self.filltype == 'annulus':
                 s += f', salgo={self.algorithm}, sigma={self.sigma}, niter={self.niter}'  # noqa: E501
             s += f', fillval={self.fillval:E}'
@@ -871,7 +966,11 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
         # Update DQ extension
         if dqsrc is not False:
             dqname = dqsrc.get('name')
-            npix = np.count_nonzero(dqdata[mask] != self._dq_fixed_flag)
+            dqsub = dqdata[y0:y1, x0:x1]
+            if mask is None:  # single pixel
+                npix = int(dqsub[pr, pc] != self._dq_fixed_flag)
+            else:
+                npix = np.count_nonzero(dqsub[rr, cc] != self._dq_fixed_flag)
 
             if npix == 0:
                 self.logger.debug('No bad DQ flags to replace')
@@ -881,7 +980,10 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             # https://github.com/spacetelescope/stginga/issues/113
             self.chinfo.switch_image(dqsrc)
 
-            dqdata[mask] = self._dq_fixed_flag
+            if mask is None:
+                dqsub[pr, pc] = self._dq_fixed_flag
+            else:
+                dqsub[rr, cc] = self._dq_fixed_flag
             s = (f'Bad pixel flag(s) replaced in {dqname}; '
                  f'dqflag={self._dq_fixed_flag}, npix={npix}')
             self.logger.info(s)
@@ -941,64 +1043,69 @@ class BadPixCorr(HelpMixin, LocalPlugin, MEFMixin, ParamMixin):
             self.logger.error('Cannot ingest parameters')
             return True
 
-        # Clear existing canvas
-        if self.bpixcorrtag:
-            try:
-                self.canvas.delete_object_by_tag(self.bpixcorrtag, redraw=True)
-            except Exception:
-                pass
-
-        # Ingest values from file. Retain current value if not found.
-
-        self.set_corrtype(pardict['corrtype'])
-        self.w.corr_type.set_index(self._corrtype_options.index(self.corrtype))
-
-        self.xcen = pardict.get('xcen', self.xcen)
-        self.ycen = pardict.get('ycen', self.ycen)
-        self.radius = pardict.get('radius', self.radius)
-        self.annulus_radius = pardict.get(
-            'annulus_radius', self.annulus_radius)
-        self.annulus_width = pardict.get('annulus_width', self.annulus_width)
-        self.algorithm = pardict.get('algorithm', self.algorithm)
-        self.sigma = pardict.get('sigma', self.sigma)
-        self.niter = pardict.get('niter', self.niter)
-        self.griddata_method = pardict.get(
-            'griddata_method', self.griddata_method)
-        self.fillval = pardict.get('fillval', self.fillval)
-
-        self.set_filltype(pardict['filltype'])
-        self.w.fill_type.set_index(self._filltype_options.index(self.filltype))
+        # Batch the canvas clear/rebuild below into a single redraw
+        with self.fitsimage.suppress_redraw:
+            # Clear existing canvas
+            if self.bpixcorrtag:
+                try:
+                    self.canvas.delete_object_by_tag(
+                        self.bpixcorrtag, redraw=False)
+                except Exception:
+                    pass
+
+            # Ingest values from file. Retain current value if not found.
+
+            self.set_corrtype(pardict['corrtype'])
+            self.w.corr_type.set_index(self._corrtype_index[self.corrtype])
+
+            self.xcen = pardict.get('xcen', self.xcen)
+            self.ycen = pardict.get('ycen', self.ycen)
+            self.radius = pardict.get('radius', self.radius)
+            self.annulus_radius = pardict.get(
+                'annulus_radius', self.annulus_radius)
+            self.annulus_width = pardict.get(
+                'annulus_width', self.annulus_width)
+            self.algorithm = pardict.get('algorithm', self.algorithm)
+            self.sigma = pardict.get('sigma', self.sigma)
+            self.niter = pardict.get('niter', self.niter)
+            self.griddata_method = pardict.get(
+                'griddata_method', self.griddata_method)
+            self.fillval = pardict.get('fillval', self.fillval)
+
+            self.set_filltype(pardict['filltype'])
+            self.w.fill_type.set_index(self._filltype_index[self.filltype])
+
+            # Draw on canvas
+            if self.corrtype == 'circle':
+                bpx_obj = self.dc.Circle(
+                    x=self.xcen, y=self.ycen, radius=self.radius,
+                    color=self.bpixcorrcolor)
+                yt = self.ycen + self.radius + self._text_label_offset
+            else:  # point
+                bpx_obj = self.dc.Point(
+                    x=self.xcen, y=self.ycen, radius=self._point_radius,
+                    color=self.bpixcorrcolor)
+                yt = self.ycen + self._text_label_offset
 
-        # Draw on canvas
-        if self.corrtype == 'circle':
-            bpx_obj = self.dc.Circle(
-                x=self.xcen, y=self.ycen, radius=self.radius,
-                color=self.bpixcorrcolor)
-            yt = self.ycen + self.radius + self._text_label_offset
-        else:  # point
-            bpx_obj = self.dc.Point(
-                x=self.xcen, y=self.ycen, radius=self._point_radius,
-                color=self.bpixcorrcolor)
-            yt = self.ycen + self._text_label_offset
+            if self.filltype in ('annulus', 'spline'):
+                yt = (self.ycen + self.annulus_radius + self.annulus_width +
+                      self._text_label_offset)
+                sig_obj = self.dc.Annulus(
+                    x=self.xcen, y=self.ycen, radius=self.annulus_radius,
+                    width=self.annulus_width, color=self.bpixannuluscolor)
+            else:
+                sig_obj = None
 
-        if self.filltype in ('annulus', 'spline'):
-            yt = (self.ycen + self.annulus_radius + self.annulus_width +
-                  self._text_label_offset)
-            sig_obj = self.dc.Annulus(
-                x=self.xcen, y=self.ycen, radius=self.annulus_radius,
-                width=self.annulus_width, color=self.bpixannuluscolor)
-        else:
-            sig_obj = None
+            lbl_obj = self.dc.Text(
+                self.xcen, yt, self._text_label, color=self.bpixcorrcolor)
 
-        lbl_obj = self.dc.Text(
-            self.xcen, yt, self._text_label, color=self.bpixcorrcolor)
+            if sig_obj is None:
+                final_obj = self.dc.CompoundObject(bpx_obj, lbl_obj)
+            else:
+                final_obj = self.dc.CompoundObject(bpx_obj, sig_obj, lbl_obj)
 
-        if sig_obj is None:
-            final_obj = self.dc.CompoundObject(bpx_obj, lbl_obj)
-        else:
-            final_obj = self.dc.CompoundObject(bpx_obj, sig_obj, lbl_obj)
+            self.bpixcorrtag = self.canvas.add(final_obj)
 
-        self.bpixcorrtag = self.canvas.add(final_obj)
         return self.redo()
 
     def close(self):
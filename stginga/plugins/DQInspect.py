@@ -377,22 +377,20 @@ class DQInspect(HelpMixin, LocalPlugin, MEFMixin):
             return self._reset_imdq_on_error()
 
         # Get cached DQ parser first, if available
-        if (telescope in self._dqparser and
-                instrument in self._dqparser[telescope]):
-            self.logger.debug(
-                f'Using cached DQ parser for {telescope}/{instrument}')
-            dqparser = self._dqparser[telescope][instrument]
+        ins_dict = self._dqparser.setdefault(telescope, {})
+        dqparser = ins_dict.get(instrument)
+        if dqparser is not None:
+            self.logger.debug('Using cached DQ parser for %s/%s',
+                              telescope, instrument)
 
         # Create new parser and cache it.
         # Look in package data first. If not found, assume external data.
         # If no data file provided, use default.
         else:
-            self.logger.debug(
-                f'Creating new DQ parser for {telescope}/{instrument}')
+            self.logger.debug('Creating new DQ parser for %s/%s',
+                              telescope, instrument)
             dqparser = self._load_dqparser(telescope, instrument)
-            if telescope not in self._dqparser:
-                self._dqparser[telescope] = {}
-            self._dqparser[telescope][instrument] = dqparser
+            ins_dict[instrument] = dqparser
 
         iminfo = self.chinfo.get_image_info(dqname)
         cur_timestamp = iminfo.get('time_modified', None)
@@ -404,14 +402,14 @@ class DQInspect(HelpMixin, LocalPlugin, MEFMixin):
         # pixmask_by_flag is {flag: np_index}
         # timestamp is datetime object or None
         if bnch is None or cur_timestamp != bnch.timestamp:
-            self.logger.debug(f'Interpreting all DQs for {dqname}...')
+            self.logger.debug('Interpreting all DQs for %s...', dqname)
             pixmask_by_flag = dqparser.interpret_array(data)
             dqsrc.metadata[self._cache_key] = Bunch.Bunch(
                 pixmask_by_flag=pixmask_by_flag, timestamp=cur_timestamp)
 
         # Get cached results first, if available.
         else:
-            self.logger.debug(f'Using cached DQ results for {dqname}')
+            self.logger.debug('Using cached DQ results for %s', dqname)
             pixmask_by_flag = bnch.pixmask_by_flag
 
         # Parse DQ into individual flag definitions
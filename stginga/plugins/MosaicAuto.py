@@ -249,7 +249,7 @@ class MosaicAuto(HelpMixin, Mosaic):
         fpwidth = self.settings.get('footprintlinewidth', 5)
         polygonlist = []
         for imname, bnch in self._imlist.items():
-            self.logger.debug(f'Drawing footprint for {imname}')
+            self.logger.debug('Drawing footprint for %s', imname)
             if bnch.footprint is None:
                 continue
             pixcrd = w.wcs_world2pix(bnch.footprint, self._wcs_origin)
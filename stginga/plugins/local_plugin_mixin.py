@@ -152,12 +152,24 @@ class MEFMixin(object):
 
         if telescope != 'HST' or instrument != 'WFPC2':
             dqname = f'{imname}[{self._dq_extname},{extver}]'
+
+            # Already loaded; no need to inspect the file again
+            if dqname in self.chinfo.datasrc:
+                return self.chinfo.datasrc[dqname]
+
             dqsrc = utils.find_ext(imfile, dq_extnum)
 
         # Special handling for WFPC2, lots of assumptions
         else:
             imfile = imfile.replace('c0m', 'c1m')
             imname = imname.replace('c0m', 'c1m')
+
+            # Already loaded; no need to inspect the file again
+            for extn in (self._dq_extname, self._sci_extname):
+                dqname = f'{imname}[{extn},{extver}]'
+                if dqname in self.chinfo.datasrc:
+                    return self.chinfo.datasrc[dqname]
+
             dqsrc = utils.find_ext(imfile, dq_extnum)
 
             if not dqsrc:
@@ -197,13 +209,12 @@ class MEFMixin(object):
         """
         # Image already loaded
         if cachekey in self.chinfo.datasrc:
-            self.logger.debug(f'Loading {cachekey} from cache')
+            self.logger.debug('Loading %s from cache', cachekey)
             image = self.chinfo.datasrc[cachekey]
 
         # Auto load image data
         else:
-            self.logger.debug(
-                f'Loading {cachekey} from {filename}')
+            self.logger.debug('Loading %s from %s', cachekey, filename)
             image = self.fv.load_image(filename, idx=extnum)
             future = Future()
             future.freeze(self.fv.load_image, filename, idx=extnum)
@@ -9,13 +9,11 @@ from astropy import wcs
 from astropy.convolution import convolve_fft, Box2DKernel
 from astropy.io import ascii, fits
 from astropy.stats import biweight_location
-from astropy.stats import sigma_clip
 from astropy.utils import minversion
 from astropy.utils.exceptions import AstropyUserWarning
 from scipy.interpolate import griddata
 from scipy.ndimage import zoom
 
-ASTROPY_LT_3_1 = not minversion('astropy', '3.1')
 GINGA_LT_3 = not minversion('ginga', '3.0')
 
 __all__ = ['calc_stat', 'interpolate_badpix', 'find_ext', 'DQParser',
@@ -55,15 +53,36 @@ def calc_stat(data, sigma=1.8, niter=10, algorithm='median'):
     if len(arr) < 1:
         return 0.0
 
-    kwargs = {'sigma': sigma}
-
-    if ASTROPY_LT_3_1:
-        kwargs['iters'] = niter
-    else:
-        kwargs['maxiters'] = niter
-
-    arr_masked = sigma_clip(arr, **kwargs)
-    arr = arr_masked.data[~arr_masked.mask]
+    # Sigma clipping with the same rejection rule as
+    # astropy.stats.sigma_clip (median center, standard deviation width,
+    # final bounds applied to the full array) but without the
+    # masked-array machinery. The data is sorted once up front: every
+    # clipped subset is then a contiguous window, so each median is an
+    # index lookup and each clip two binary searches instead of a full
+    # compare-and-gather pass.
+    arr = np.sort(arr[np.isfinite(arr)])  # Also drop invalid values
+    clipped = arr
+    lo = hi = np.nan  # NaN bounds mean no clipping was applied
+
+    for _ in range(niter):
+        n = len(clipped)
+        if n < 1:
+            lo = hi = np.nan
+            break
+        # Scale each term before adding so integer input cannot overflow
+        med = 0.5 * clipped[(n - 1) // 2] + 0.5 * clipped[n // 2]
+        width = sigma * clipped.std()
+        lo = med - width
+        hi = med + width
+        i0 = np.searchsorted(clipped, lo, side='left')
+        i1 = np.searchsorted(clipped, hi, side='right')
+        if i1 - i0 == n:  # Converged
+            break
+        clipped = clipped[i0:i1]
+
+    if not np.isnan(lo):
+        arr = arr[np.searchsorted(arr, lo, side='left'):
+                  np.searchsorted(arr, hi, side='right')]
 
     if len(arr) < 1:
         return 0.0
@@ -234,11 +253,16 @@ class DQParser(object):
         data = np.asarray(data, dtype=np.uint)  # Ensure uint array
         dqs_by_flag = {}
 
-        def _one_flag(vf):
-            dqs_by_flag[vf] = np.where((data & vf) != 0)
+        # Flagged pixels are usually sparse, so locate them once and
+        # test each flag against just those values, instead of sweeping
+        # the whole array once per flag.
+        idx = np.nonzero(data)
+        dqvals = data[idx]
 
         # Skip good flag
-        list(map(_one_flag, self._valid_flags[1:]))
+        for vf in self._valid_flags[1:]:
+            sel = (dqvals & vf) != 0
+            dqs_by_flag[vf] = tuple(ix[sel] for ix in idx)
 
         return dqs_by_flag
 